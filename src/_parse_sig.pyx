@@ -0,0 +1,52 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of the signature parsers in utils.py
+(_split_top_level_args / _extract_types_from_signature), same results.
+utils.py falls back to the pure-Python ones when this is not built:
+
+    cythonize -i src/_parse_sig.pyx
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cdef inline void _append_stripped(list parts, str s, Py_ssize_t start, Py_ssize_t end):
+    # s[start:end].strip(), skipping empty parts
+    while start < end and Py_UNICODE_ISSPACE(s[start]):
+        start += 1
+    while end > start and Py_UNICODE_ISSPACE(s[end - 1]):
+        end -= 1
+    if end > start:
+        parts.append(s[start:end])
+
+
+cpdef list split_top_level_args(str types_str):
+    """
+    Split a Solidity type list string at top-level commas, preserving tuples/arrays.
+    """
+    cdef list parts = []
+    cdef Py_ssize_t i, start = 0, n = len(types_str)
+    cdef int depth = 0
+    cdef Py_UCS4 ch
+    for i in range(n):
+        ch = types_str[i]
+        if ch == u'(':
+            depth += 1
+        elif ch == u')':
+            depth -= 1
+        elif ch == u',' and depth == 0:
+            _append_stripped(parts, types_str, start, i)
+            start = i + 1
+    _append_stripped(parts, types_str, start, n)
+    return parts
+
+
+cpdef list extract_types(str signature):
+    """
+    Argument type strings of 'name(t1,t2,...)'.
+    """
+    cdef Py_ssize_t l = signature.find('(')
+    cdef Py_ssize_t r = signature.rfind(')')
+    if l == -1 or r == -1 or r < l:
+        raise ValueError(f"Malformed signature: {signature}")
+    return split_top_level_args(signature[l + 1:r])
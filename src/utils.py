@@ -1,29 +1,79 @@
-from typing import List, Dict, Any, Optional
+import sys
+from collections import namedtuple
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
 from eth_abi import decode as abi_decode
-from eth_utils import to_checksum_address
+
+try:
+    from sha3 import keccak_256 as _keccak  # pysha3 (C extension)
+except ImportError:
+    from Crypto.Hash import keccak as _crypto_keccak
+
+    def _keccak(data: bytes):
+        return _crypto_keccak.new(digest_bits=256, data=data)
 
 # ---------------- parsing utils ----------------
 
+# byte -> 0x20 (the ASCII case bit) for hex digits 8-f of the hash, and for
+# the letters a-f of the address; everything else -> 0
+_HASH_NIBBLE_HI = bytes(0x20 if chr(i) in '89abcdef' else 0 for i in range(256))
+_HEX_LETTER = bytes(0x20 if chr(i) in 'abcdef' else 0 for i in range(256))
+
+
+def fast_to_checksum_address(addr: str) -> str:
+    """
+    EIP-55 checksum of a 0x-prefixed hex address, hashing with keccak directly
+    instead of going through eth_utils.to_checksum_address.
+    A char is upper-cased iff the matching nibble of keccak(lower_hex) >= 8.
+    The per-char loop runs as bytes.translate + big-int ops, i.e. in C: the
+    case bit (0x20) is flipped where both translated masks have it set.
+    Raises ValueError unless addr is '0x' followed by 40 hex chars.
+    """
+    if len(addr) != 42 or addr[:2] != '0x' or not addr[2:].isascii():
+        raise ValueError(f"Not a 0x-prefixed 20-byte hex address: {addr!r}")
+    hex_addr = addr[2:].lower().encode('ascii')
+    if hex_addr.translate(None, b'0123456789abcdef'):
+        raise ValueError(f"Not a 0x-prefixed 20-byte hex address: {addr!r}")
+    digest = _keccak(hex_addr).hexdigest()[:40].encode('ascii')
+    flip = (int.from_bytes(digest.translate(_HASH_NIBBLE_HI), 'big')
+            & int.from_bytes(hex_addr.translate(_HEX_LETTER), 'big'))
+    return '0x' + (int.from_bytes(hex_addr, 'big') ^ flip).to_bytes(40, 'big').decode('ascii')
+
+
+@lru_cache(maxsize=8192)
+def _cksum(addr: str) -> str:
+    """
+    Checksum an address as returned by eth-abi (0x-prefixed lowercase hex).
+    Routers, tokens and pools recur across transactions, so the keccak
+    behind the checksum is only paid once per distinct address.
+    """
+    return fast_to_checksum_address(addr)
+
+
 def _split_top_level_args(types_str: str) -> List[str]:
     """
     Split a Solidity type list string at top-level commas, preserving tuples/arrays.
     E.g. "(address,address,uint24,int24,address),(bool,int256,uint160),bytes"
     -> ["(address,address,uint24,int24,address)", "(bool,int256,uint160)", "bytes"]
     """
-    parts, buf, depth = [], [], 0
-    for ch in types_str:
+    if '(' not in types_str and ')' not in types_str:
+        return [p for p in (p.strip() for p in types_str.split(',')) if p]
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(types_str):
         if ch == '(':
             depth += 1
         elif ch == ')':
             depth -= 1
         elif ch == ',' and depth == 0:
-            parts.append(''.join(buf).strip())
-            buf = []
-            continue
-        buf.append(ch)
-    if buf:
-        parts.append(''.join(buf).strip())
-    return [p for p in parts if p != ""]
+            part = types_str[start:i].strip()
+            if part:
+                parts.append(part)
+            start = i + 1
+    tail = types_str[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
 
 
 def _extract_types_from_signature(signature: str) -> List[str]:
@@ -42,93 +92,523 @@ def _extract_types_from_signature(signature: str) -> List[str]:
     return _split_top_level_args(inner)
 
 
-def _postprocess_value(sol_type: str, value: Any) -> Any:
+try:
+    # Cython build of the two parsers above (src/_parse_sig.pyx)
+    from _parse_sig import (split_top_level_args as _split_top_level_args,
+                            extract_types as _extract_types_from_signature)
+except ImportError:
+    pass
+
+
+# dict keys of decoded tuple fields, built (and interned) once instead of per value
+_IDX_KEYS = tuple(sys.intern(f"_{i}") for i in range(64))
+
+
+def _tuple_keys(n: int) -> tuple:
+    if n <= len(_IDX_KEYS):
+        return _IDX_KEYS[:n]
+    return tuple(f"_{i}" for i in range(n))
+
+
+def _to_hex(value: bytes) -> str:
+    return '0x' + value.hex()
+
+
+# composite postprocessing nodes, see _compile_node
+_ARRAY, _TUPLE = 0, 1
+
+
+@lru_cache(maxsize=512)
+def _compile_node(sol_type: str) -> Any:
     """
-    Niceties for readability:
-    - addresses -> checksum 0x...
-    - bytes -> 0x-hex
-    - tuples and nested structures handled recursively
+    Parse a type string once into a postprocessing node:
+    - None: value is kept as-is (bool/int/uint*)
+    - a callable: elementary conversion (address, bytes*), or `list` for
+      arrays whose items are kept as-is
+    - (_ARRAY, item_node) / (_TUPLE, keys, field_nodes) for composites
     """
+    t = sol_type
     # normalize type (strip spaces)
-    t = sol_type.replace(" ", "")
+    if ' ' in t:
+        t = t.replace(" ", "")
+    if not t:
+        return None
     # arrays: T[], T[k]
-    if t.endswith(']'):
+    if t[-1] == ']':
         # find base type
-        base = t[:t.rfind('[')]
-        return [_postprocess_value(base, v) for v in value]
+        item = _compile_node(t[:t.rfind('[')])
+        if item is None:
+            return list
+        return (_ARRAY, item)
 
+    head = t[0]
     # tuple: (t1,t2,...)
-    if t.startswith('(') and t.endswith(')'):
-        subtypes = _split_top_level_args(t[1:-1])
-        return {f"_{i}": _postprocess_value(subtypes[i], value[i]) for i in range(len(subtypes))}
+    if head == '(':
+        if t[-1] != ')':
+            return None
+        fields = tuple(_compile_node(st) for st in _split_top_level_args(t[1:-1]))
+        return (_TUPLE, _tuple_keys(len(fields)), fields)
 
     # elementary
-    if t == 'address':
-        return to_checksum_address(value)
-    if t.startswith('bytes') and t != 'bytes':
-        # fixed-size bytesN -> hex
-        return '0x' + value.hex()
-    if t == 'bytes':
-        return '0x' + value.hex()
+    if head == 'a':
+        return _cksum if t == 'address' else None
+    if head == 'b' and t.startswith('bytes'):
+        # bytes and fixed-size bytesN -> hex
+        return _to_hex
     # bool/int/uint* left as-is (Python int/bool)
-    return value
+    return None
 
 
-def parse_tx_input(calldata_hex: str,
-                   selectors: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+def _node_pp(node: Any) -> Optional[Callable[[Any], Any]]:
+    """Postprocessor for a _compile_node node: one closure per composite level."""
+    if type(node) is not tuple:
+        return node
+    if node[0] is _ARRAY:
+        fn = _node_pp(node[1])
+        return lambda arr: [fn(v) for v in arr]
+    keys = node[1]
+    fns = [_node_pp(field) for field in node[2]]
+    return lambda tup: {k: v if fn is None else fn(v)
+                        for k, fn, v in zip(keys, fns, tup)}
+
+
+@lru_cache(maxsize=512)
+def _compile_pp(sol_type: str) -> Optional[Callable[[Any], Any]]:
     """
-    Parse a hex calldata string using a function-selector dictionary.
-    Returns a dict with selector, name, signature, arg_types, args_decoded.
+    Build the postprocessor for a type string once instead of re-parsing
+    the type for every value (see _postprocess_value).
+    Returns None for types whose values are kept as-is (bool/int/uint*),
+    so callers can skip the call entirely.
     """
-    if calldata_hex.startswith('0x'):
-        calldata_hex = calldata_hex[2:]
-    if len(calldata_hex) < 8:
-        raise ValueError("Calldata too short to contain a selector.")
-    selector = '0x' + calldata_hex[:8]
-    body_hex = calldata_hex[8:]
-    body_bytes = bytes.fromhex(body_hex)
+    return _node_pp(_compile_node(sol_type))
 
-    entry: Optional[Dict[str, str]] = selectors.get(selector)
-    if not entry:
-        return {
-            "selector": selector,
-            "known": False,
-            "error": "Unknown function selector",
-        }
 
-    signature = entry['signature']
-    name = entry['name']
-    arg_types = _extract_types_from_signature(signature)
+def _postprocess_value(sol_type: str, value: Any) -> Any:
+    """
+    Niceties for readability:
+    - addresses -> checksum 0x...
+    - bytes -> 0x-hex
+    - tuples and nested structures handled recursively
+    """
+    fn = _compile_pp(sol_type)
+    return value if fn is None else fn(value)
+
+
+# Hand-rolled decoders for the most frequent argument layouts, keyed on
+# arg_types. They read fixed 32-byte head slots directly instead of walking
+# eth-abi's type tree, and return the post-processed args. Anything they
+# cannot vouch for (short data, dirty padding, non-canonical offsets) returns
+# None so abi_decode runs and raises/decodes exactly as before.
+# They take the whole calldata (slot k at raw[4+32k:36+32k]) so the body is
+# never copied out; small bytes slices beat memoryview slices at these sizes.
+_ZERO_12 = bytes(12)
+_ZERO_31 = bytes(31)
+
+
+def _decode_address(raw: bytes) -> Optional[tuple]:
+    # balanceOf(address)
+    if len(raw) < 36 or raw[4:16] != _ZERO_12:
+        return None
+    return (_cksum('0x' + raw[16:36].hex()),)
+
+
+def _decode_address_uint(raw: bytes) -> Optional[tuple]:
+    # transfer/approve/burn(address,uint256)
+    if len(raw) < 68 or raw[4:16] != _ZERO_12:
+        return None
+    return (_cksum('0x' + raw[16:36].hex()),
+            int.from_bytes(raw[36:68], 'big'))
+
+
+def _decode_address_address_uint(raw: bytes) -> Optional[tuple]:
+    # transferFrom(address,address,uint256)
+    if len(raw) < 100 or raw[4:16] != _ZERO_12 or raw[36:48] != _ZERO_12:
+        return None
+    return (_cksum('0x' + raw[16:36].hex()),
+            _cksum('0x' + raw[48:68].hex()),
+            int.from_bytes(raw[68:100], 'big'))
+
+
+def _decode_v3_swap(raw: bytes) -> Optional[tuple]:
+    # swap(address recipient, bool zeroForOne, int256 amountSpecified,
+    #      uint160 sqrtPriceLimitX96, bytes data), data at the canonical offset
+    if (len(raw) < 196 or raw[4:16] != _ZERO_12
+            or raw[36:67] != _ZERO_31 or raw[67] > 1
+            or raw[100:112] != _ZERO_12
+            or int.from_bytes(raw[132:164], 'big') != 160):
+        return None
+    size = int.from_bytes(raw[164:196], 'big')
+    end = 196 + size
+    padded_end = 196 + -(-size // 32) * 32
+    if len(raw) < padded_end or raw[end:padded_end].count(0) != padded_end - end:
+        return None
+    return (_cksum('0x' + raw[16:36].hex()),
+            raw[67] == 1,
+            int.from_bytes(raw[68:100], 'big', signed=True),
+            int.from_bytes(raw[100:132], 'big'),
+            '0x' + raw[196:end].hex())
+
+
+_FAST_DECODERS: Dict[tuple, Callable[[bytes], Optional[tuple]]] = {
+    ('address',): _decode_address,
+    ('address', 'uint256'): _decode_address_uint,
+    ('address', 'address', 'uint256'): _decode_address_address_uint,
+    ('address', 'bool', 'int256', 'uint160', 'bytes'): _decode_v3_swap,
+}
+
+
+def _static_slot(sol_type: str) -> Optional[tuple]:
+    """(kind, arg) for elementary types encoded in a single head slot."""
+    if sol_type == 'address':
+        return ('address', 0)
+    if sol_type == 'bool':
+        return ('bool', 0)
+    for prefix, kind in (('uint', 'uint'), ('int', 'int'), ('bytes', 'bytesN')):
+        if sol_type.startswith(prefix):
+            size = sol_type[len(prefix):]
+            if kind != 'bytesN' and not size:
+                return (kind, 256)
+            if size.isdigit() and 0 < int(size) <= (32 if kind == 'bytesN' else 256):
+                return (kind, int(size))
+            return None
+    return None
+
+
+def _make_plan(arg_types: tuple) -> Optional[tuple]:
+    """
+    Decoding plan (kind, slot_start, arg) per argument when every argument
+    is elementary and static (address, bool, uintN, intN, bytesN), else None.
+    """
+    plan = []
+    for i, t in enumerate(arg_types):
+        slot = _static_slot(t)
+        if slot is None:
+            return None
+        plan.append((slot[0], 4 + 32 * i, slot[1]))
+    return tuple(plan)
 
-    if not arg_types:
-        # no-arg function
+
+def _run_plan(plan: tuple, size: int, raw: bytes) -> Optional[tuple]:
+    """
+    Generic fast decoder for static-head signatures, following a plan from
+    _make_plan. Like the hand-rolled decoders it returns post-processed args,
+    or None whenever eth-abi would have to decide (short data, bad padding).
+    """
+    if len(raw) < size:
+        return None
+    out = []
+    for kind, a, arg in plan:
+        b = a + 32
+        if kind == 'address':
+            if raw[a:a + 12] != _ZERO_12:
+                return None
+            out.append(_cksum('0x' + raw[a + 12:b].hex()))
+        elif kind == 'uint':
+            v = int.from_bytes(raw[a:b], 'big')
+            if v >> arg:
+                return None
+            out.append(v)
+        elif kind == 'int':
+            v = int.from_bytes(raw[a:b], 'big', signed=True)
+            if not -(1 << (arg - 1)) <= v < (1 << (arg - 1)):
+                return None
+            out.append(v)
+        elif kind == 'bool':
+            v = int.from_bytes(raw[a:b], 'big')
+            if v > 1:
+                return None
+            out.append(v == 1)
+        else:
+            # bytesN, right-padded
+            if raw[a + arg:b].count(0) != 32 - arg:
+                return None
+            out.append('0x' + raw[a:a + arg].hex())
+    return tuple(out)
+
+
+# Per-signature decoding state, see _prepare
+_Prepared = namedtuple(
+    '_Prepared', 'arg_types postprocessors needs_pp plan fast_decoder')
+
+
+@lru_cache(maxsize=1024)
+def _prepare(signature: str) -> _Prepared:
+    """
+    Precompute decoding state for a signature so parse_tx_input does not
+    re-parse it on every call. Keyed on the signature string rather than
+    stored in the selector entry, so caller dicts are never modified and
+    an edited signature is picked up on the next call:
+    - arg_types: argument type strings of the signature
+    - postprocessors: one callable per argument, None when the decoded
+      value is kept as-is (see _compile_pp)
+    - needs_pp: False when every argument is kept as-is (only bool/int/uint*)
+    - plan: per-argument slot plan when all arguments are static
+      elementary types (see _make_plan), else None
+    - fast_decoder: hand-rolled decoder for the arg layout, _run_plan over
+      the plan, or None
+    """
+    arg_types = tuple(_extract_types_from_signature(signature))
+    postprocessors = tuple(_compile_pp(t) for t in arg_types)
+    plan = _make_plan(arg_types) if arg_types else None
+    fast_decoder = _FAST_DECODERS.get(arg_types)
+    if fast_decoder is None and plan is not None:
+        fast_decoder = partial(_run_plan, plan, 4 + 32 * len(arg_types))
+    return _Prepared(arg_types, postprocessors,
+                     any(fn is not None for fn in postprocessors),
+                     plan, fast_decoder)
+
+
+class ParsedTx(namedtuple(
+        'ParsedTx',
+        'selector known name signature arg_types args_decoded error')):
+    """
+    Result of parse_tx_input. Tuple arguments decode to dicts and arrays to
+    lists; every call gets its own copies, even when served from the cache.
+    Unknown selectors have known=False and an error message.
+    """
+    __slots__ = ()
+
+    def asdict(self) -> Dict[str, Any]:
+        """Plain dict of the fields (selector/known/error only when unknown)."""
+        if not self.known:
+            return {
+                "selector": self.selector,
+                "known": False,
+                "error": self.error,
+            }
         return {
-            "selector": selector,
+            "selector": self.selector,
             "known": True,
-            "name": name,
-            "signature": signature,
-            "arg_types": [],
-            "args_decoded": []
+            "name": self.name,
+            "signature": self.signature,
+            "arg_types": list(self.arg_types),
+            "args_decoded": list(self.args_decoded)
         }
 
+
+def _decode_args(prep: _Prepared, raw: bytes) -> tuple:
+    # raw is the whole calldata, selector included
+    fast_decoder = prep.fast_decoder
+    if fast_decoder is not None:
+        args = fast_decoder(raw)
+        if args is not None:
+            return args
+
     # eth-abi expects a list like ["address","uint256","(bool,int256,uint160)","bytes"]
-    decoded = abi_decode(arg_types, body_bytes)
+    decoded = abi_decode(prep.arg_types, raw[4:])
+    if not prep.needs_pp:
+        return decoded
 
     # Post-process for readability (addresses, bytes, tuples, arrays)
-    pretty = []
-    for t, v in zip(arg_types, decoded):
-        pretty.append(_postprocess_value(t, v))
+    return tuple(v if fn is None else fn(v)
+                 for fn, v in zip(prep.postprocessors, decoded))
+
+
+def _calldata_bytes(calldata_hex: str) -> bytes:
+    # decode once; the selector and argument slots are read from the bytes
+    start = 2 if calldata_hex[:2] == '0x' else 0
+    if len(calldata_hex) - start < 8:
+        raise ValueError("Calldata too short to contain a selector.")
+    return bytes.fromhex(calldata_hex[start:])
+
+
+def _lookup(raw: bytes,
+            selectors: Dict[str, Dict[str, Any]]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """(selector, entry) for the first 4 bytes of raw; entry is None if unknown."""
+    sel_int = int.from_bytes(raw[:4], 'big')
+    if selectors is f_selector_dict:
+        hit = _SEL_INT.get(sel_int)
+        # trust the import-time index only while the live entry is unchanged
+        if hit is not None and selectors.get(hit[0]) is hit[1]:
+            return hit
+    # other selector dicts, or entries added/replaced/deleted after import
+    selector = '0x%08x' % sel_int
+    return selector, selectors.get(selector) or None
+
+
+def _parse_tx_input(calldata_hex: str,
+                    selectors: Dict[str, Dict[str, Any]]) -> ParsedTx:
+    raw = _calldata_bytes(calldata_hex)
+    selector, entry = _lookup(raw, selectors)
+    if entry is None:
+        return ParsedTx(selector, False, None, None, (), (),
+                        "Unknown function selector")
+    signature = entry['signature']
+    prep = _prepare(signature)
+
+    if not prep.arg_types:
+        # no-arg function
+        return ParsedTx(selector, True, entry['name'], signature, (), (), None)
+
+    return ParsedTx(selector, True, entry['name'], signature,
+                    prep.arg_types, _decode_args(prep, raw), None)
+
+
+@lru_cache(maxsize=4096)
+def _parse_tx_input_cached(calldata_hex: str) -> ParsedTx:
+    # bot templates and arbitrage routes repeat the exact same calldata
+    return _parse_tx_input(calldata_hex, f_selector_dict)
+
+
+def _copy_nested(value: Any) -> Any:
+    # decoded args only nest dicts (tuples) and lists (arrays); leaves are
+    # immutable str/int/bool
+    t = type(value)
+    if t is dict:
+        return {k: _copy_nested(v) for k, v in value.items()}
+    if t is list:
+        return [_copy_nested(v) for v in value]
+    return value
+
+
+def _unshare(parsed: ParsedTx) -> ParsedTx:
+    """Copy of a cached ParsedTx whose nested dicts/lists are the caller's own."""
+    args = parsed.args_decoded
+    for v in args:
+        if type(v) is dict or type(v) is list:
+            return parsed._replace(args_decoded=tuple(_copy_nested(v) for v in args))
+    return parsed
+
+
+def parse_tx_input(calldata_hex: str,
+                   selectors: Dict[str, Dict[str, Any]]) -> ParsedTx:
+    """
+    Parse a hex calldata string using a function-selector dictionary.
+    Returns a ParsedTx with selector, name, signature, arg_types,
+    args_decoded (use .asdict() for a plain dict).
+
+    Calls with the module's f_selector_dict are served from an LRU cache
+    keyed on calldata_hex (see parse_tx_input.cache_info/cache_clear; clear
+    it after editing f_selector_dict).
+    """
+    if selectors is f_selector_dict:
+        return _unshare(_parse_tx_input_cached(calldata_hex))
+    return _parse_tx_input(calldata_hex, selectors)
+
+
+parse_tx_input.cache_info = _parse_tx_input_cached.cache_info
+parse_tx_input.cache_clear = _parse_tx_input_cached.cache_clear
+
+
+def parse_tx_inputs(calldatas: Iterable[str],
+                    selectors: Optional[Dict[str, Dict[str, Any]]] = None
+                    ) -> Iterator[ParsedTx]:
+    """
+    Batch version of parse_tx_input: yields one ParsedTx per calldata,
+    using f_selector_dict when no selectors are given.
+    Results do not go through (or evict) the parse_tx_input LRU cache.
+    """
+    if selectors is None:
+        selectors = f_selector_dict
+    for calldata_hex in calldatas:
+        yield _parse_tx_input(calldata_hex, selectors)
+
+
+def _freeze_fields(fields: Any) -> Any:
+    # hashable form of an entry's 'fields' (lists -> tuples), for _column_plan
+    if isinstance(fields, (list, tuple)):
+        return tuple(_freeze_fields(f) for f in fields)
+    return fields
+
 
-    return {
-        "selector": selector,
-        "known": True,
-        "name": name,
-        "signature": signature,
-        "arg_types": arg_types,
-        "args_decoded": pretty
-    }
+def _plan_columns(node: Any, name: Any, path: tuple, out: list) -> None:
+    if type(node) is tuple and node[0] is _TUPLE:
+        keys, fields = node[1], node[2]
+        names = name if isinstance(name, tuple) else tuple(name + k for k in keys)
+        for i, (sub_name, sub_node) in enumerate(zip(names, fields)):
+            _plan_columns(sub_node, sub_name, path + (i,), out)
+    else:
+        out.append((name, path, _node_pp(node)))
 
 
+def _path_getter(path: tuple) -> Callable[[Any], Any]:
+    if len(path) == 1:
+        return itemgetter(path[0])
+    if len(path) == 2:
+        i, j = path
+        return lambda decoded: decoded[i][j]
+
+    def get(decoded):
+        for i in path:
+            decoded = decoded[i]
+        return decoded
+    return get
+
+
+@lru_cache(maxsize=256)
+def _column_plan(signature: str, fields: Any) -> tuple:
+    """
+    Flat (column name, getter, postprocessor) list for parse_tx_inputs_soa:
+    one column per elementary/array value, tuple arguments flattened.
+    fields is the frozen 'fields' entry (see _freeze_fields) or None;
+    without names, argument i is "_i" and tuple fields get f"{name}_{j}".
+    Raises ValueError if fields does not name every argument/tuple field
+    exactly once (see _check_fields).
+    """
+    arg_types = _prepare(signature).arg_types
+    if fields is None:
+        fields = _tuple_keys(len(arg_types))
+    else:
+        problem = _check_fields(list(arg_types), fields)
+        if problem:
+            raise ValueError(f"{signature}: 'fields' {problem}")
+    out: list = []
+    for i, (t, name) in enumerate(zip(arg_types, fields)):
+        _plan_columns(_compile_node(t), name, (i,), out)
+    names = [name for name, _, _ in out]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{signature}: 'fields' has duplicate column names")
+    return tuple((name, _path_getter(path), fn, len(path)) for name, path, fn in out)
+
+
+def parse_tx_inputs_soa(calldatas: Iterable[str], selector: str,
+                        selectors: Optional[Dict[str, Dict[str, Any]]] = None
+                        ) -> Dict[str, List[Any]]:
+    """
+    Decode every calldata calling `selector` into columns (one list per
+    argument / tuple field) instead of one dict per transaction, e.g. for
+    the Uniswap v4 swap: {'currency0': [...], 'fee': [...], ...}.
+    Column names come from the entry's 'fields' (positional "_i" names
+    otherwise); a 'fields' list that does not match the signature raises
+    ValueError. Calldata for other selectors is skipped, so the columns are
+    not aligned with `calldatas`.
+    """
+    if selectors is None:
+        selectors = f_selector_dict
+    sel_raw = _calldata_bytes(selector)[:4]
+    selector, entry = _lookup(sel_raw, selectors)
+    if entry is None:
+        raise KeyError(selector)
+    signature = entry['signature']
+    prep = _prepare(signature)
+    plan = _column_plan(signature, _freeze_fields(entry.get('fields')))
+    columns: Dict[str, List[Any]] = {name: [] for name, _, _, _ in plan}
+    if not plan:
+        return columns
+    appends = [columns[name].append for name, _, _, _ in plan]
+    steps = [(append, get, fn) for append, (_, get, fn, _) in zip(appends, plan)]
+    # fast decoders only cover flat layouts: their args map 1:1 to columns,
+    # already post-processed
+    fast_decoder = prep.fast_decoder
+    if any(depth != 1 for _, _, _, depth in plan):
+        fast_decoder = None
+    arg_types = prep.arg_types
+    for calldata_hex in calldatas:
+        raw = _calldata_bytes(calldata_hex)
+        if raw[:4] != sel_raw:
+            continue
+        if fast_decoder is not None:
+            args = fast_decoder(raw)
+            if args is not None:
+                for append, v in zip(appends, args):
+                    append(v)
+                continue
+        decoded = abi_decode(arg_types, raw[4:])
+        for append, get, fn in steps:
+            v = get(decoded)
+            append(v if fn is None else fn(v))
+    return columns
+
 
 # Curated list of topics 0 mapped to Event names
 # https://www.4byte.directory/event-signatures/
@@ -147,7 +627,8 @@ f_selector_dict['0xa9059cbb'] = {
 
 
 f_selector_dict['0x128acb08'] = {
-    'name': 'swap', 'signature': 'swap(address,bool,int256,uint160,bytes)'
+    'name': 'swap', 'signature': 'swap(address,bool,int256,uint160,bytes)',
+    'fields': ['recipient', 'zeroForOne', 'amountSpecified', 'sqrtPriceLimitX96', 'data']
 }
 
 f_selector_dict['0x23b872dd'] = {
@@ -164,7 +645,10 @@ f_selector_dict['0x91dd7346'] = {
 }
 
 f_selector_dict['0xf3cd914c'] = {
-    'name': 'swap', 'signature': 'swap((address,address,uint24,int24,address),(bool,int256,uint160),bytes)'
+    'name': 'swap', 'signature': 'swap((address,address,uint24,int24,address),(bool,int256,uint160),bytes)',
+    'fields': [('currency0', 'currency1', 'fee', 'tickSpacing', 'hooks'),
+               ('zeroForOne', 'amountSpecified', 'sqrtPriceLimitX96'),
+               'hookData']
 }
 
 f_selector_dict['0xd0c93a7c'] = {
@@ -251,7 +735,9 @@ f_selector_dict['0x883bdbfd'] = {
 }
 
 f_selector_dict['0x72c98186'] = {
-    'name': 'onSwap', 'signature': 'onSwap((uint8,uint256,uint256[],uint256,uint256,address,bytes))'
+    'name': 'onSwap', 'signature': 'onSwap((uint8,uint256,uint256[],uint256,uint256,address,bytes))',
+    'fields': [('kind', 'amountGivenScaled18', 'balancesScaled18', 'indexIn',
+                'indexOut', 'router', 'userData')]
 }
 
 f_selector_dict['0x36c78516'] = {
@@ -259,7 +745,9 @@ f_selector_dict['0x36c78516'] = {
 }
 
 f_selector_dict['0x2bfb780c'] = {
-    'name': 'swap', 'signature': 'swap((uint8,address,address,address,uint256,uint256,bytes))'
+    'name': 'swap', 'signature': 'swap((uint8,address,address,address,uint256,uint256,bytes))',
+    'fields': [('kind', 'pool', 'tokenIn', 'tokenOut', 'amountGivenRaw', 'limitRaw',
+                'userData')]
 }
 
 f_selector_dict['0xd15e0053'] = {
@@ -328,7 +816,10 @@ f_selector_dict['0xf30dba93'] = {
     'name': 'ticks', 'signature': 'ticks(int24)'
 }
 f_selector_dict['0x8c00bf6b'] = {
-    'name': 'borrowRateView', 'signature': 'borrowRateView((address,address,address,address,uint256),(uint128,uint128,uint128,uint128,uint128,uint128))'
+    'name': 'borrowRateView', 'signature': 'borrowRateView((address,address,address,address,uint256),(uint128,uint128,uint128,uint128,uint128,uint128))',
+    'fields': [('loanToken', 'collateralToken', 'oracle', 'irm', 'lltv'),
+               ('totalSupplyAssets', 'totalSupplyShares', 'totalBorrowAssets',
+                'totalBorrowShares', 'lastUpdate', 'fee')]
 }
 f_selector_dict['0xe468baf0'] = {
     'name': 'allWhitelistedTokens', 'signature': 'allWhitelistedTokens(uint256)'
@@ -343,7 +834,10 @@ f_selector_dict['0xee63c1e5'] = {
     'name': 'swapUniV3', 'signature': 'swapUniV3()'
 }
 f_selector_dict['0x9d2c110c'] = {
-    'name': 'onSwap', 'signature': 'onSwap((uint8,address,address,uint256,bytes32,uint256,address,address,bytes),uint256,uint256)'
+    'name': 'onSwap', 'signature': 'onSwap((uint8,address,address,uint256,bytes32,uint256,address,address,bytes),uint256,uint256)',
+    'fields': [('kind', 'tokenIn', 'tokenOut', 'amount', 'poolId', 'lastChangeBlock',
+                'from', 'to', 'userData'),
+               'balanceTokenIn', 'balanceTokenOut']
 }
 f_selector_dict['0x87517c45'] = {
     'name': 'approve', 'signature': 'approve(address,address,uint160,uint48)'
@@ -364,7 +858,8 @@ f_selector_dict['0x61461954'] = {
 }
 
 f_selector_dict['0x0c49ccbe'] = {
-    'name': 'decreaseLiquidity', 'signature': 'decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))'
+    'name': 'decreaseLiquidity', 'signature': 'decreaseLiquidity((uint256,uint128,uint256,uint256,uint256))',
+    'fields': [('tokenId', 'liquidity', 'amount0Min', 'amount1Min', 'deadline')]
 }
 f_selector_dict['0xf90c6906'] = {
     'name': 'priceFeeds', 'signature': 'priceFeeds(address,address)'
@@ -386,3 +881,59 @@ f_selector_dict['0x927da105'] = {
     'name': 'allowance', 'signature': 'allowance(address,address,address)'
 }
 
+
+def _check_entry(selector: str, entry: Dict[str, Any]) -> Optional[str]:
+    """Problem with a selector table entry, or None if it is well-formed."""
+    if len(selector) != 10 or selector[:2] != '0x':
+        return f"{selector}: selector is not 0x + 8 hex chars"
+    try:
+        int(selector, 16)
+    except ValueError:
+        return f"{selector}: selector is not 0x + 8 hex chars"
+    signature = entry['signature']
+    if not signature.startswith(entry['name'] + '('):
+        return f"{selector}: name {entry['name']!r} does not match {signature!r}"
+    try:
+        arg_types = _extract_types_from_signature(signature)
+    except ValueError as e:
+        return f"{selector}: {e}"
+    fields = entry.get('fields')
+    if fields is not None:
+        try:
+            _column_plan(signature, _freeze_fields(fields))
+        except ValueError as e:
+            return f"{selector}: {e}"
+    return None
+
+
+def _check_fields(types: List[str], fields: Any) -> Optional[str]:
+    # one name per type; a tuple of names only for tuple types, same arity
+    if not isinstance(fields, (list, tuple)) or len(fields) != len(types):
+        return f"needs one name per argument of {types}"
+    for t, name in zip(types, fields):
+        if isinstance(name, (list, tuple)):
+            t = t.replace(" ", "")
+            if not (t[:1] == '(' and t[-1:] == ')'):
+                return f"gives names {name} for non-tuple type {t}"
+            problem = _check_fields(_split_top_level_args(t[1:-1]), name)
+            if problem:
+                return problem
+        elif not isinstance(name, str):
+            return f"has a non-string name {name!r}"
+    return None
+
+
+# Signatures are static: validate and parse them once at import time, and
+# report every bad entry in a single error rather than failing in the hot
+# path. _SEL_INT maps the selector as an int (first 4 calldata bytes,
+# big-endian) to (selector, entry), so the hot path does not format a
+# hex string. The entries themselves are left untouched, and
+# _lookup re-checks each hit against the live dict so later edits win.
+_problems = [p for p in (_check_entry(k, e) for k, e in f_selector_dict.items()) if p]
+if _problems:
+    raise ValueError("Malformed f_selector_dict entries:\n" + "\n".join(_problems))
+_SEL_INT: Dict[int, tuple] = {}
+for _sel, _entry in f_selector_dict.items():
+    _prepare(_entry['signature'])
+    _SEL_INT[int(_sel, 16)] = (_sel, _entry)
+del _problems, _sel, _entry
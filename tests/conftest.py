@@ -0,0 +1,5 @@
+import os
+import sys
+
+# utils.py is imported as a top-level module, as the notebooks do
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
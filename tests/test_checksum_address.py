@@ -0,0 +1,50 @@
+"""
+fast_to_checksum_address against eth_utils.to_checksum_address.
+"""
+import random
+
+import pytest
+from eth_utils import to_checksum_address
+
+from utils import fast_to_checksum_address
+
+
+def _addresses():
+    rnd = random.Random(0)
+    yield '0x' + '00' * 20
+    yield '0x' + 'ff' * 20
+    yield '0x' + 'ab' * 20
+    for _ in range(2000):
+        yield '0x%040x' % rnd.getrandbits(160)
+
+
+@pytest.mark.parametrize('case', [str.lower, str.upper, str.swapcase])
+def test_matches_eth_utils(case):
+    for addr in _addresses():
+        addr = '0x' + case(addr[2:])
+        assert fast_to_checksum_address(addr) == to_checksum_address(addr)
+
+
+def test_checksummed_input_is_unchanged():
+    for addr in _addresses():
+        checksummed = to_checksum_address(addr)
+        assert fast_to_checksum_address(checksummed) == checksummed
+
+
+@pytest.mark.parametrize('addr', [
+    '',
+    '0x',
+    '11' * 20,                    # no prefix
+    '0X' + '11' * 20,             # upper-case prefix
+    '0x' + '11' * 19,             # too short
+    '0x' + '11' * 21,             # too long
+    '0x' + '11' * 19 + '1',       # odd length
+    '0x' + '11' * 19 + 'g1',      # non-hex
+    '0x' + '11' * 19 + ' 1',
+    '0x' + '11' * 19 + '-1',
+    '0x' + '11' * 19 + 'é1',  # non-ASCII
+    '0x' + '11' * 19 + '١١',  # non-ASCII digits
+])
+def test_invalid_input_raises(addr):
+    with pytest.raises(ValueError):
+        fast_to_checksum_address(addr)
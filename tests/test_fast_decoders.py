@@ -0,0 +1,154 @@
+"""
+Differential tests for the fast-path decoders in utils.py (_FAST_DECODERS and
+the _run_plan static-head plans): on any input they must either return
+exactly what abi_decode + post-processing returns, or None so that
+abi_decode decides (and raises where it raises).
+"""
+import random
+
+import pytest
+from eth_abi import encode
+
+import utils
+from utils import abi_decode, _postprocess_value, _prepare
+
+SELECTOR = bytes.fromhex('deadbeef')
+
+LAYOUTS = [
+    # hand-rolled decoders
+    ('address',),
+    ('address', 'uint256'),
+    ('address', 'address', 'uint256'),
+    ('address', 'bool', 'int256', 'uint160', 'bytes'),
+    # _run_plan
+    ('bool',),
+    ('int24',),
+    ('uint8', 'int16'),
+    ('bytes32',),
+    ('bytes4', 'uint160'),
+    ('address', 'bool'),
+    ('int256', 'uint24', 'address'),
+]
+
+
+def _random_value(t, rnd):
+    if t == 'address':
+        return '0x%040x' % rnd.getrandbits(160)
+    if t == 'bool':
+        return rnd.random() < 0.5
+    if t == 'bytes':
+        return bytes(rnd.getrandbits(8) for _ in range(rnd.choice([0, 1, 31, 32, 33, 70])))
+    if t.startswith('bytes'):
+        return bytes(rnd.getrandbits(8) for _ in range(int(t[5:])))
+    if t.startswith('uint'):
+        bits = int(t[4:])
+        return rnd.choice([0, 1, (1 << bits) - 1, rnd.getrandbits(bits)])
+    bits = int(t[3:])
+    return rnd.choice([0, -1, -(1 << (bits - 1)), (1 << (bits - 1)) - 1,
+                       rnd.getrandbits(bits - 1) * rnd.choice([1, -1])])
+
+
+def _fast_decoder(arg_types):
+    fast_decoder = _prepare('f(%s)' % ','.join(arg_types)).fast_decoder
+    assert fast_decoder is not None
+    return fast_decoder
+
+
+def _reference(arg_types, raw):
+    try:
+        decoded = abi_decode(arg_types, raw[4:])
+    except Exception:
+        return None
+    return tuple(_postprocess_value(t, v) for t, v in zip(arg_types, decoded))
+
+
+def _assert_agrees(arg_types, raw):
+    got = _fast_decoder(arg_types)(raw)
+    if got is not None:
+        assert got == _reference(arg_types, raw), raw.hex()
+
+
+def _valid_calldata(arg_types, rnd):
+    return SELECTOR + encode(list(arg_types), [_random_value(t, rnd) for t in arg_types])
+
+
+@pytest.mark.parametrize('arg_types', LAYOUTS)
+def test_valid_data(arg_types):
+    rnd = random.Random(0)
+    for _ in range(50):
+        raw = _valid_calldata(arg_types, rnd)
+        got = _fast_decoder(arg_types)(raw)
+        assert got is not None
+        assert got == _reference(arg_types, raw)
+        # trailing bytes are ignored by eth-abi as well
+        assert _fast_decoder(arg_types)(raw + bytes(32)) == got
+
+
+@pytest.mark.parametrize('arg_types', LAYOUTS)
+def test_single_byte_mutations(arg_types):
+    # dirty padding, out-of-range int/uint/bool and bad offsets/lengths all
+    # come down to one wrong byte somewhere in the encoding
+    rnd = random.Random(1)
+    for _ in range(3):
+        raw = _valid_calldata(arg_types, rnd)
+        for pos in range(4, len(raw)):
+            for flip in (0x01, 0x80, 0xff):
+                mutated = bytearray(raw)
+                mutated[pos] ^= flip
+                _assert_agrees(arg_types, bytes(mutated))
+
+
+@pytest.mark.parametrize('arg_types', LAYOUTS)
+def test_short_and_truncated_data(arg_types):
+    rnd = random.Random(2)
+    raw = _valid_calldata(arg_types, rnd)
+    for end in range(4, len(raw)):
+        truncated = raw[:end]
+        assert _reference(arg_types, truncated) is None
+        assert _fast_decoder(arg_types)(truncated) is None
+
+
+@pytest.mark.parametrize('arg_types, slot, word', [
+    (('address',), 0, (1 << 160).to_bytes(32, 'big')),
+    (('address', 'uint256'), 0, b'\xff' * 32),
+    (('bool',), 0, (2).to_bytes(32, 'big')),
+    (('uint8', 'int16'), 0, (256).to_bytes(32, 'big')),
+    (('uint8', 'int16'), 1, (1 << 15).to_bytes(32, 'big')),
+    (('int24',), 0, (-(1 << 23) - 1).to_bytes(32, 'big', signed=True)),
+    (('bytes4', 'uint160'), 0, b'\x01' * 5 + bytes(27)),
+    (('bytes4', 'uint160'), 1, (1 << 160).to_bytes(32, 'big')),
+    (('address', 'bool', 'int256', 'uint160', 'bytes'), 1, (2).to_bytes(32, 'big')),
+    (('address', 'bool', 'int256', 'uint160', 'bytes'), 3, (1 << 160).to_bytes(32, 'big')),
+])
+def test_out_of_range_slot(arg_types, slot, word):
+    raw = bytearray(_valid_calldata(arg_types, random.Random(3)))
+    raw[4 + 32 * slot:36 + 32 * slot] = word
+    raw = bytes(raw)
+    assert _reference(arg_types, raw) is None
+    assert _fast_decoder(arg_types)(raw) is None
+
+
+def test_v3_swap_bytes_padding_and_offset():
+    arg_types = ('address', 'bool', 'int256', 'uint160', 'bytes')
+    head = encode(['address', 'bool', 'int256', 'uint160'],
+                  ['0x' + '11' * 20, True, -5, 7])
+    data = b'\x01\x02\x03'
+    tail = len(data).to_bytes(32, 'big') + data + bytes(29)
+
+    canonical = SELECTOR + head + (160).to_bytes(32, 'big') + tail
+    assert _fast_decoder(arg_types)(canonical) == _reference(arg_types, canonical)
+
+    # dirty padding after the payload: eth-abi raises, fast path defers
+    dirty = canonical[:-1] + b'\x01'
+    assert _reference(arg_types, dirty) is None
+    assert _fast_decoder(arg_types)(dirty) is None
+
+    # non-canonical offset: valid for eth-abi, left to it by the fast path
+    gap = SELECTOR + head + (192).to_bytes(32, 'big') + bytes(32) + tail
+    assert _reference(arg_types, gap) is not None
+    assert _fast_decoder(arg_types)(gap) is None
+
+
+def test_fast_decoders_are_used_for_table_layouts():
+    for arg_types in utils._FAST_DECODERS:
+        assert _prepare('f(%s)' % ','.join(arg_types)).fast_decoder is utils._FAST_DECODERS[arg_types]
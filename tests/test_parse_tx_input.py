@@ -0,0 +1,81 @@
+"""
+parse_tx_input / parse_tx_inputs against the module's f_selector_dict.
+"""
+import copy
+
+import pytest
+from eth_abi import encode
+
+import utils
+from utils import f_selector_dict, parse_tx_input, parse_tx_inputs
+
+BALANCE_OF = '0x70a08231' + '00' * 12 + '11' * 20
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    parse_tx_input.cache_clear()
+    yield
+    parse_tx_input.cache_clear()
+
+
+def test_replaced_entry_is_used(monkeypatch):
+    assert parse_tx_input(BALANCE_OF, f_selector_dict).name == 'balanceOf'
+    monkeypatch.setitem(f_selector_dict, '0x70a08231',
+                        {'name': 'foo', 'signature': 'foo(uint256)'})
+    parse_tx_input.cache_clear()
+
+    parsed = parse_tx_input(BALANCE_OF, f_selector_dict)
+    assert (parsed.name, parsed.arg_types, parsed.args_decoded) == \
+        ('foo', ('uint256',), (int('11' * 20, 16),))
+    assert next(parse_tx_inputs([BALANCE_OF])).name == 'foo'
+
+
+def test_deleted_entry_is_unknown(monkeypatch):
+    assert parse_tx_input(BALANCE_OF, f_selector_dict).known
+    monkeypatch.delitem(f_selector_dict, '0x70a08231')
+    parse_tx_input.cache_clear()
+
+    for parsed in (parse_tx_input(BALANCE_OF, f_selector_dict),
+                   next(parse_tx_inputs([BALANCE_OF]))):
+        assert not parsed.known
+        assert parsed.error == "Unknown function selector"
+
+
+def test_entry_added_after_import(monkeypatch):
+    calldata = '0x12345678' + '00' * 31 + '01'
+    monkeypatch.setitem(f_selector_dict, '0x12345678',
+                        {'name': 'bar', 'signature': 'bar(bool)'})
+    assert 0x12345678 not in utils._SEL_INT
+    assert parse_tx_input(calldata, f_selector_dict).args_decoded == (True,)
+
+
+def _calldata(signature, types, args):
+    selector = next(s for s, e in f_selector_dict.items() if e['signature'] == signature)
+    return selector + encode(types, args).hex()
+
+
+def test_cached_tuple_is_not_shared():
+    calldata = _calldata(
+        'swap((address,address,uint24,int24,address),(bool,int256,uint160),bytes)',
+        ['(address,address,uint24,int24,address)', '(bool,int256,uint160)', 'bytes'],
+        [('0x' + '11' * 20, '0x' + '22' * 20, 3000, 60, '0x' + '00' * 20),
+         (True, -1, 4295128740), b'\x01'])
+    first = parse_tx_input(calldata, f_selector_dict)
+    expected = copy.deepcopy(first)
+    first.args_decoded[0]['_0'] = 'mutated'
+    first.args_decoded[1]['_1'] = 0
+    assert parse_tx_input(calldata, f_selector_dict) == expected
+    assert parse_tx_input.cache_info().hits == 1
+
+
+def test_cached_list_is_not_shared():
+    calldata = _calldata('executeBatch((bytes,bytes)[],bytes)',
+                         ['(bytes,bytes)[]', 'bytes'],
+                         [[(b'\x01', b'\x02'), (b'\x03', b'')], b'\x04'])
+    first = parse_tx_input(calldata, f_selector_dict)
+    expected = copy.deepcopy(first)
+    first.args_decoded[0][0]['_0'] = 'mutated'
+    first.args_decoded[0].append('mutated')
+    assert parse_tx_input(calldata, f_selector_dict) == expected
+    assert parse_tx_input.cache_info().hits == 1
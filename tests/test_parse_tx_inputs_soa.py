@@ -0,0 +1,58 @@
+"""
+parse_tx_inputs_soa against row-wise parse_tx_input.
+"""
+import pytest
+from eth_abi import encode
+
+from utils import f_selector_dict, parse_tx_input, parse_tx_inputs_soa
+
+V4_SWAP = '0xf3cd914c'
+V4_SWAP_TYPES = ['(address,address,uint24,int24,address)', '(bool,int256,uint160)', 'bytes']
+V4_SWAP_ARGS = [('0x' + '11' * 20, '0x' + '22' * 20, 3000, 60, '0x' + '00' * 20),
+                (True, -10 ** 18, 4295128740),
+                b'\x01\x02']
+
+
+def _v4_swap_calldata():
+    return V4_SWAP + encode(V4_SWAP_TYPES, V4_SWAP_ARGS).hex()
+
+
+def _table(fields):
+    entry = dict(f_selector_dict[V4_SWAP], fields=fields)
+    return {V4_SWAP: entry}
+
+
+def test_columns_match_rows():
+    calldata = _v4_swap_calldata()
+    columns = parse_tx_inputs_soa([calldata, '0xa9059cbb' + '00' * 64], V4_SWAP)
+    row = parse_tx_input(calldata, f_selector_dict).args_decoded
+    assert columns == {
+        'currency0': [row[0]['_0']], 'currency1': [row[0]['_1']],
+        'fee': [3000], 'tickSpacing': [60], 'hooks': [row[0]['_4']],
+        'zeroForOne': [True], 'amountSpecified': [-10 ** 18],
+        'sqrtPriceLimitX96': [4295128740], 'hookData': ['0x0102'],
+    }
+
+
+def test_uppercase_selector():
+    assert parse_tx_inputs_soa([_v4_swap_calldata()], V4_SWAP.upper().replace('X', 'x'))['fee'] == [3000]
+
+
+@pytest.mark.parametrize('fields', [
+    ['a', 'b'],
+    ['a', 'b', 'c', 'd'],
+    [('a', 'b'), 'c', 'd'],
+    ['a', ('b', 'c'), 'd'],
+    [('a', 'b', 'c', 'd', 'e'), ('f', 'g', 'h'), 7],
+    [('a', 'b', 'c', 'd', 'e'), ('f', 'g', 'a'), 'i'],
+])
+def test_bad_fields_raise(fields):
+    with pytest.raises(ValueError):
+        parse_tx_inputs_soa([_v4_swap_calldata()], V4_SWAP, _table(fields))
+
+
+def test_bad_fields_flat_layout():
+    table = {'0xa9059cbb': {'name': 'transfer', 'signature': 'transfer(address,uint256)',
+                            'fields': ['to']}}
+    with pytest.raises(ValueError):
+        parse_tx_inputs_soa(['0xa9059cbb' + '00' * 64], '0xa9059cbb', table)